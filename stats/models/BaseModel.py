@@ -1,8 +1,9 @@
 from peewee import *
-from settings import Settings
 
-settings = Settings()
+# Bound to a real database by the loaders via database_proxy.initialize(),
+# so the model definitions can be imported without opening a connection.
+database_proxy = DatabaseProxy()
 
 class BaseModel(Model):
     class Meta:
-        database = settings.db
+        database = database_proxy
@@ -0,0 +1,11 @@
+from peewee import *
+from models import BaseModel
+
+class QuarantinedRows(BaseModel):
+    table_name = CharField(null = True)
+    season_id = CharField(null = True)
+    reason = CharField(null = True)
+    payload = TextField(null = True)  # the rejected row as json
+
+    class Meta:
+        db_table = 'quarantined_rows'
@@ -1,4 +1,4 @@
-from .BaseModel import BaseModel
+from .BaseModel import BaseModel, database_proxy
 
 # Season Totals Tables
 from .PlayerGeneralTraditionalTotals import PlayerGeneralTraditionalTotals
@@ -10,4 +10,7 @@ from .TeamGameLogs import TeamGameLogs
 
 # Misc Tables
 from .PlayerBios import PlayerBios
-from .PlayerGameLogs import PlayerGameLogs
\ No newline at end of file
+from .PlayerGameLogs import PlayerGameLogs
+
+# Data Quality Tables
+from .QuarantinedRows import QuarantinedRows
@@ -1,11 +1,11 @@
 # player_bios.py - scraps data from stats.nba.com and inserts into player_bios table within MySQL nba stats database
+import sys
+
 import requests
 
 from settings import Settings
-from models import PlayerGameLogs
-
-settings = Settings()
-settings.db.create_tables([PlayerGameLogs], safe=True)
+from models import PlayerGameLogs, QuarantinedRows, database_proxy
+from validation import insert_validated
 
 headers  = {
     'Connection': 'keep-alive',
@@ -52,49 +52,64 @@ per_mode = 'Totals'
 #per_mode = 'Per36'
 #per_mode = 'PerGame'
 
-# for loop to loop over seasons
-for season_id in season_list:
-    print("Now working on "+season_id+ " season")
-    player_info_url = 'https://stats.nba.com/stats/leaguegamelog?Counter=1000&DateFrom=&DateTo=&Direction=DESC&LeagueID=00&PlayerOrTeam='+type_player+'&Season='+season_id+'&SeasonType=Regular+Season&Sorter=DATE'
-    # json response
-    response = requests.get(url=player_info_url, headers=headers).json()
-    # pulling just the data we want
-    player_info = response['resultSets'][0]['rowSet']
-    # looping over data to insert into table
-    for row in player_info:
-        player = PlayerGameLogs(
-            season_id=season_id,  # this is key, need this to join and sort by seasons
-            player_id=row[1],
-            player_name=row[2],
-            team_id=row[3],
-            team_abbreviation=row[4],
-            team_name=row[5],
-            game_id=row[6],
-            game_date=row[7],        
-            matchup=row[8],
-            wl=row[9],
-            min=row[10],
-            fgm=row[11],
-            fga=row[12],
-            fg_pct=row[13],
-            fg3m=row[14],
-            fg3a=row[15],
-            fg3_pct=row[16],
-            ftm=row[17],
-            fta=row[18],
-            ft_pct=row[19],
-            oreb=row[20],
-            dreb=row[21],
-            reb=row[22],
-            ast=row[23],
-            stl=row[24],
-            blk=row[25],
-            tov=row[26],
-            pf=row[27],
-            pts=row[28],
-            plus_minus=row[29],
-            video_available=row[30]
-            )
-        player.save()
+type_player = 'P'
+
+def main(seasons=season_list):
+    settings = Settings()
+    database_proxy.initialize(settings.db)
+    settings.db.create_tables([PlayerGameLogs, QuarantinedRows], safe=True)
+
+    # for loop to loop over seasons
+    for season_id in seasons:
+        print("Now working on "+season_id+ " season")
+        player_info_url = 'https://stats.nba.com/stats/leaguegamelog?Counter=1000&DateFrom=&DateTo=&Direction=DESC&LeagueID=00&PlayerOrTeam='+type_player+'&Season='+season_id+'&SeasonType=Regular+Season&Sorter=DATE'
+        # json response
+        response = requests.get(url=player_info_url, headers=headers).json()
+        # pulling just the data we want
+        player_info = response['resultSets'][0]['rowSet']
+        # looping over data to build the season batch
+        rows = []
+        for row in player_info:
+            rows.append(dict(
+                season_id=season_id,  # this is key, need this to join and sort by seasons
+                player_id=row[1],
+                player_name=row[2],
+                team_id=row[3],
+                team_abbreviation=row[4],
+                team_name=row[5],
+                game_id=row[6],
+                game_date=row[7],        
+                matchup=row[8],
+                wl=row[9],
+                min=row[10],
+                fgm=row[11],
+                fga=row[12],
+                fg_pct=row[13],
+                fg3m=row[14],
+                fg3a=row[15],
+                fg3_pct=row[16],
+                ftm=row[17],
+                fta=row[18],
+                ft_pct=row[19],
+                oreb=row[20],
+                dreb=row[21],
+                reb=row[22],
+                ast=row[23],
+                stl=row[24],
+                blk=row[25],
+                tov=row[26],
+                pf=row[27],
+                pts=row[28],
+                plus_minus=row[29],
+                video_available=row[30]
+                ))
+        # validate the whole season, insert the good rows and quarantine the rest
+        inserted, quarantined = insert_validated(PlayerGameLogs, rows)
+        print("Done with "+season_id+": "+str(inserted)+" rows inserted, "+str(quarantined)+" quarantined")
+
+    print ("Done inserting player bios data to the database!")
+
 
-print ("Done inserting player bios data to the database!")
\ No newline at end of file
+if __name__ == '__main__':
+    # optionally pass one or more seasons, e.g. python player_game_logs.py 2019-20
+    main(sys.argv[1:] or season_list)
@@ -1,21 +1,18 @@
 import os
 from dotenv import load_dotenv
-load_dotenv()
 
 from peewee import *
 
-DB_NAME = os.getenv('DB_NAME')
-DB_HOST = os.getenv('DB_HOST')
-DB_USER = os.getenv('DB_USER')
-DB_PASSWORD = os.getenv('DB_PASSWORD')
-
 class Settings:
     def __init__(self):
+        # Environment is only read when a loader actually needs a connection,
+        # so importing settings or models stays free of I/O.
+        load_dotenv()
         self.db = MySQLDatabase(
-            DB_NAME,
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD,
+            os.getenv('DB_NAME'),
+            host=os.getenv('DB_HOST'),
+            user=os.getenv('DB_USER'),
+            password=os.getenv('DB_PASSWORD'),
             charset='utf8mb4'
         )
         self.user_agent = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/48.0.2564.82 Safari/537.36"
@@ -0,0 +1,134 @@
+# validation.py - checks each season batch before it is inserted and quarantines the rows that fail
+import json
+from collections import Counter
+from itertools import compress, count
+
+from peewee import IntegerField, FloatField, chunked
+
+from models import QuarantinedRows
+
+# ids we always need to join on, when the model has them
+REQUIRED_COLUMNS = ('season_id', 'player_id', 'team_id', 'game_id')
+
+# counting stats that can never be negative
+NON_NEGATIVE_COLUMNS = (
+    'age', 'gp', 'w', 'l', 'min',
+    'fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta',
+    'oreb', 'dreb', 'reb', 'ast', 'stl', 'blk', 'blka', 'tov', 'pf', 'pfd', 'pts',
+)
+
+# *_pct columns are fractions between 0 and 1, except shooting efficiency
+# where an all-threes line tops out at 1.5
+PCT_UPPER_BOUNDS = {
+    'efg_pct': 1.5,
+    'ts_pct': 1.5,
+}
+
+# rows per INSERT statement, keeps us well under max_allowed_packet
+INSERT_BATCH_SIZE = 1000
+
+_rules_cache = {}
+
+
+def _is_null(value):
+    return value is None
+
+
+def _is_not_numeric(value):
+    return value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)))
+
+
+def _is_negative(value):
+    return isinstance(value, (int, float)) and value < 0
+
+
+def _outside(upper):
+    return lambda value: isinstance(value, (int, float)) and not 0 <= value <= upper
+
+
+def _column_check(name, predicate):
+    # map() over the whole column and compress() out the failing positions
+    return lambda columns: compress(count(), map(predicate, columns[name]))
+
+
+def _team_mismatches(columns):
+    # within one season a team_id should only ever carry one abbreviation,
+    # so anything that disagrees with its most common pairing is suspect
+    pairs = list(zip(columns['team_id'], columns['team_abbreviation']))
+    expected = {}
+    for (team_id, abbreviation), n in Counter(pairs).most_common():
+        expected.setdefault(team_id, abbreviation)
+    return compress(count(), (expected[team_id] != abbreviation for team_id, abbreviation in pairs))
+
+
+def build_rules(model):
+    """Derive the (reason, columns, check) rules for a model from its fields."""
+    if model in _rules_cache:
+        return _rules_cache[model]
+
+    fields = model._meta.fields
+    rules = []
+    for name in REQUIRED_COLUMNS:
+        if name in fields:
+            rules.append(('null ' + name, (name,), _column_check(name, _is_null)))
+    for name, field in fields.items():
+        if name == 'id' or not isinstance(field, (IntegerField, FloatField)):
+            continue
+        rules.append(('non-numeric ' + name, (name,), _column_check(name, _is_not_numeric)))
+        if name in NON_NEGATIVE_COLUMNS:
+            rules.append(('negative ' + name, (name,), _column_check(name, _is_negative)))
+        if name.endswith('_pct'):
+            upper = PCT_UPPER_BOUNDS.get(name, 1)
+            rules.append((name + ' out of range', (name,), _column_check(name, _outside(upper))))
+    if 'team_id' in fields and 'team_abbreviation' in fields:
+        rules.append(('team_id does not match team_abbreviation',
+                      ('team_id', 'team_abbreviation'), _team_mismatches))
+
+    _rules_cache[model] = rules
+    return rules
+
+
+def validate(model, rows):
+    """Split a batch of decoded rows into (valid, quarantined) lists.
+
+    Each rule runs over a whole column at once rather than row by row. The
+    quarantined rows are shaped for QuarantinedRows.
+    """
+    if not rows:
+        return [], []
+
+    columns = {name: [row.get(name) for row in rows] for name in rows[0]}
+    reasons = [[] for _ in rows]
+    for reason, needs, check in build_rules(model):
+        # the loader may not fill in every column the model has
+        if not all(name in columns for name in needs):
+            continue
+        for i in check(columns):
+            reasons[i].append(reason)
+
+    valid = []
+    quarantined = []
+    for row, row_reasons in zip(rows, reasons):
+        if not row_reasons:
+            valid.append(row)
+            continue
+        quarantined.append(dict(
+            table_name=model._meta.table_name,
+            season_id=row.get('season_id'),
+            reason='; '.join(row_reasons)[:255],
+            payload=json.dumps(row, default=str)))
+    return valid, quarantined
+
+
+def insert_validated(model, rows):
+    """Validate a season batch, insert the good rows and quarantine the rest.
+
+    Returns the number of (inserted, quarantined) rows.
+    """
+    valid, quarantined = validate(model, rows)
+    with model._meta.database.atomic():
+        for batch in chunked(valid, INSERT_BATCH_SIZE):
+            model.insert_many(batch).execute()
+        for batch in chunked(quarantined, INSERT_BATCH_SIZE):
+            QuarantinedRows.insert_many(batch).execute()
+    return len(valid), len(quarantined)